@@ -26,4 +26,11 @@ options:
     choices: [ http, https ]
     default: https
     aliases: [protocol]
+  keep_session:
+    description:
+      - If true, the REST API session ID is saved to a file in C(~/.ansible/tmp) that only the current user can read.
+      - Subsequent tasks using the same hostname, username, and port will reuse the saved session instead of logging in again.
+      - If the saved session is no longer valid, a new session is created and saved.
+    type: bool
+    default: false
 '''
@@ -128,7 +128,8 @@ class VmwareInventoryBase(BaseInventoryPlugin, Constructable, Cacheable):
                 'validate_certs': self.get_option("validate_certs"),
                 'http_proxy_host': self.get_option("proxy_host"),
                 'http_proxy_port': self.get_option("proxy_port"),
-                'http_proxy_protocol': self.get_option("proxy_protocol")
+                'http_proxy_protocol': self.get_option("proxy_protocol"),
+                'keep_session': self.get_option("keep_session")
             })
         except Exception as e:
             raise AnsibleParserError(message=to_native(e))
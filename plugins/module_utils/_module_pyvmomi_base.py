@@ -64,9 +64,11 @@ class ModulePyvmomiBase(PyvmomiClient):
         obj = list()
         container = self.content.viewManager.CreateContainerView(
             search_root_folder, vimtype, True)
+        object_names = self.__get_object_names_in_container_view(container, vimtype)
 
         for c in container.view:
-            if name in [c.name, c._GetMoId()]:
+            moid = c._GetMoId()
+            if name in [object_names.get(moid), moid]:
                 if return_all is False:
                     return c
                 else:
@@ -78,6 +80,44 @@ class ModulePyvmomiBase(PyvmomiClient):
             # for backwards-compat
             return None
 
+    def __get_object_names_in_container_view(self, container, vimtype):
+        """
+        Get the names of all objects in a container view with one property collector request.
+        Reading the name attribute of each object would make a separate request per object.
+        Args:
+            container: vim.view.ContainerView, The view to get the object names from
+            vimtype: The types of objects in the view
+        Returns:
+            dict, object MOIDs mapped to their names
+        """
+        traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+            name='traverseEntities',
+            path='view',
+            skip=False,
+            type=vim.view.ContainerView
+        )
+        object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+            obj=container,
+            skip=True,
+            selectSet=[traversal_spec]
+        )
+        property_specs = [
+            vmodl.query.PropertyCollector.PropertySpec(type=_type, pathSet=['name'])
+            for _type in vimtype
+        ]
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[object_spec],
+            propSet=property_specs
+        )
+
+        object_names = dict()
+        for object_content in self.content.propertyCollector.RetrieveContents([filter_spec]):
+            for prop in object_content.propSet:
+                if prop.name == 'name':
+                    object_names[object_content.obj._GetMoId()] = prop.val
+
+        return object_names
+
     def get_standard_portgroup_by_name_or_moid(self, identifier, fail_on_missing=False):
         """
         Get a portgroup from type 'STANDARD_PORTGROUP' based on name or MOID
@@ -16,6 +16,10 @@ def rest_compatible_argument_spec():
                 choices=['https', 'http'],
                 aliases=['protocol']
             ),
+            keep_session=dict(
+                type='bool',
+                default=False
+            ),
         )
     }
 
@@ -12,6 +12,7 @@ __metaclass__ = type
 
 import json
 import os
+from collections import deque
 
 PYVMOMI_IMP_ERR = None
 try:
@@ -430,38 +431,38 @@ def deserialize_snapshot_obj(obj):
             'quiesced': obj.quiesced}
 
 
-def list_snapshots_recursively(snapshots):
-    snapshot_data = []
-    for snapshot in snapshots:
-        snapshot_data.append(deserialize_snapshot_obj(snapshot))
-        snapshot_data = snapshot_data + list_snapshots_recursively(snapshot.childSnapshotList)
-    return snapshot_data
-
-
-def get_current_snap_obj(snapshots, snapob):
-    snap_obj = []
-    for snapshot in snapshots:
-        if snapshot.snapshot == snapob:
-            snap_obj.append(snapshot)
-        snap_obj = snap_obj + get_current_snap_obj(snapshot.childSnapshotList, snapob)
-    return snap_obj
+def walk_snapshot_tree(snapshots):
+    """
+    Iterate over every snapshot tree node, starting from the given nodes. Parents are returned before
+    their children, in the same order a depth first recursive search would return them.
+    """
+    queue = deque(snapshots)
+    while queue:
+        snapshot = queue.popleft()
+        yield snapshot
+        queue.extendleft(reversed(snapshot.childSnapshotList))
 
 
 def list_snapshots(vm):
     result = {}
-    snapshot = get_vm_prop_or_none(vm, ('snapshot',))
-    if not snapshot:
-        return result
-    if vm.snapshot is None:
+    # each access of vm.snapshot is a separate property request, so only read it once.
+    # the result holds the whole snapshot tree as data objects, so walking the tree makes no more requests
+    snapshot_info = get_vm_prop_or_none(vm, ('snapshot',))
+    if not snapshot_info:
         return result
 
-    result['snapshots'] = list_snapshots_recursively(vm.snapshot.rootSnapshotList)
-    current_snapref = vm.snapshot.currentSnapshot
-    current_snap_obj = get_current_snap_obj(vm.snapshot.rootSnapshotList, current_snapref)
-    if current_snap_obj:
-        result['current_snapshot'] = deserialize_snapshot_obj(current_snap_obj[0])
-    else:
-        result['current_snapshot'] = dict()
+    # gather the snapshot list and find the current snapshot in a single pass over the tree
+    snapshots = []
+    current_snapshot = dict()
+    current_snapref = snapshot_info.currentSnapshot
+    for snapshot in walk_snapshot_tree(snapshot_info.rootSnapshotList):
+        snapshot_data = deserialize_snapshot_obj(snapshot)
+        snapshots.append(snapshot_data)
+        if not current_snapshot and snapshot.snapshot == current_snapref:
+            current_snapshot = dict(snapshot_data)
+
+    result['snapshots'] = snapshots
+    result['current_snapshot'] = current_snapshot
     return result
 
 
@@ -11,12 +11,22 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import os
+import ssl
+import json
+import hashlib
 import traceback
+from functools import lru_cache, cached_property
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import requests
+    from requests import Session
+    from requests.adapters import HTTPAdapter, DEFAULT_CA_BUNDLE_PATH
     REQUESTS_IMP_ERR = None
 except ImportError:
+    Session = object
+    HTTPAdapter = object
     REQUESTS_IMP_ERR = traceback.format_exc()
 
 try:
@@ -42,23 +52,144 @@ from ansible_collections.vmware.vmware.plugins.module_utils.clients._errors impo
     MissingLibError
 )
 
+_REQUIREMENTS_OK = REQUESTS_IMP_ERR is None and VSPHERE_IMP_ERR is None
+
+SESSION_CACHE_DIR = '~/.ansible/tmp'
+
+# this should not be larger than the session's connection pool size
+MAX_TAG_REQUEST_THREADS = 8
+
+# requests sessions are shared between clients with the same connection parameters so
+# connections can be kept alive and reused, instead of being reopened for each client
+_SESSION_CACHE = {}
+
+# urllib3 warnings are disabled process wide, so this only needs to happen once
+_INSECURE_REQUEST_WARNING_DISABLED = False
+
+
+def _get_ca_bundle():
+    """
+    Get the CA bundle that requests will use to verify certificates. This follows the same
+    environment variables that requests checks.
+    """
+    return os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE') or DEFAULT_CA_BUNDLE_PATH
+
+
+@lru_cache(maxsize=None)
+def _get_ssl_context(validate_certs, ca_bundle=None):
+    """
+    Build the SSL context that is shared by all sessions. Loading the CA bundle is expensive,
+    so it should only be done once per process.
+    """
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if validate_certs:
+        if os.path.isdir(ca_bundle):
+            ssl_context.load_verify_locations(capath=ca_bundle)
+        else:
+            ssl_context.load_verify_locations(cafile=ca_bundle)
+    else:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    return ssl_context
+
+
+@lru_cache(maxsize=1024)
+def _get_dynamic_id(object_type, object_id):
+    """
+    Build a DynamicID for a vSphere object. DynamicID validates its fields against the type
+    definition when it is created, so reuse them when the same object is looked up again.
+    """
+    return DynamicID(type=object_type, id=object_id)
+
+
+class _KeptSessionService():
+    """
+    Replaces the SDK session service of a client whose session is saved for later runs. The SDK
+    deletes the session when the client is deleted, but a saved session needs to stay logged in.
+    """
+    def delete(self):
+        pass
+
+
+class _SslContextHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that uses a prebuilt SSL context for all of its connection pools
+    """
+    def __init__(self, ssl_context, ca_bundle=None, *args, **kwargs):
+        self.ssl_context = ssl_context
+        self.ca_bundle = ca_bundle
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # the CA bundle is already loaded in the SSL context. If urllib3 is given the bundle
+        # as well, it loads it into the context again for every new connection.
+        if not self.ca_bundle:
+            return
+        if conn.ca_certs == self.ca_bundle:
+            conn.ca_certs = None
+        if conn.ca_cert_dir == self.ca_bundle:
+            conn.ca_cert_dir = None
+
+
+class _SharedSession(Session):
+    """
+    Requests session that is shared between clients. The SDK mounts its own adapters on the session
+    for each client it creates, and closes the session when a client is deleted. Either would drop
+    the open connections of every other client using the session, so they are ignored.
+    """
+    def mount(self, prefix, adapter):
+        if prefix not in self.adapters:
+            super().mount(prefix, adapter)
+
+    def close(self):
+        pass
+
 
 class VmwareRestClient():
     def __init__(self, connection_params):
         self.check_requirements()
         self.api_client = self.connect_to_api(connection_params)
+        self._tag_cache = {}
+
+    # Service stubs are only created when they are first used, since most
+    # modules only need one or two of them
+
+    @cached_property
+    def library_service(self):
+        return self.api_client.content.Library
+
+    @cached_property
+    def library_item_service(self):
+        return self.api_client.content.library.Item
 
-        self.library_service = self.api_client.content.Library
-        self.library_item_service = self.api_client.content.library.Item
+    @cached_property
+    def tag_service(self):
+        return self.api_client.tagging.Tag
 
-        self.tag_service = self.api_client.tagging.Tag
-        self.tag_association_service = self.api_client.tagging.TagAssociation
-        self.tag_category_service = self.api_client.tagging.Category
+    @cached_property
+    def tag_association_service(self):
+        return self.api_client.tagging.TagAssociation
+
+    @cached_property
+    def tag_category_service(self):
+        return self.api_client.tagging.Category
 
     def check_requirements(self):
         """
         Check all requirements for this client are satisfied
         """
+        if _REQUIREMENTS_OK:
+            return
         if REQUESTS_IMP_ERR:
             raise MissingLibError('requests', REQUESTS_IMP_ERR)
         if VSPHERE_IMP_ERR:
@@ -82,17 +213,20 @@ class VmwareRestClient():
         username = connection_params.get('username')
         password = connection_params.get('password')
         port = connection_params.get('port', 443)
-        validate_certs = connection_params.get('validate_certs')
+        # certificates are validated unless the user explicitly disables it
+        validate_certs = connection_params.get('validate_certs') is not False
         http_proxy_host = connection_params.get('http_proxy_host')
         http_proxy_port = connection_params.get('http_proxy_port')
         http_proxy_protocol = connection_params.get('http_proxy_protocol')
+        keep_session = connection_params.get('keep_session', False)
 
         self.__validate_required_connection_params(hostname, username, password)
 
-        session = requests.Session()
-
-        self.__configure_session_ssl_context(session, validate_certs)
-        self.__configure_session_proxies(session, http_proxy_host, http_proxy_port, http_proxy_protocol)
+        session = self.__get_session(
+            hostname, username, port, validate_certs, http_proxy_host, http_proxy_port, http_proxy_protocol
+        )
+        if keep_session:
+            return self.__create_client_connection_from_session_cache(session, hostname, username, password, port)
         return self.__create_client_connection(session, hostname, username, password, port)
 
     def __validate_required_connection_params(self, hostname, username, password):
@@ -119,33 +253,143 @@ class VmwareRestClient():
                 "export environment variable like 'export VMWARE_PASSWORD=ESXI_PASSWORD'"
             ))
 
+    def __get_session(self, hostname, username, port, validate_certs, http_proxy_host, http_proxy_port, http_proxy_protocol):
+        """
+        Get a requests session for the connection parameters. If a session with the same parameters
+        was already created in this process, it is reused. Sessions keep cookies, so they are never
+        shared between different users or servers.
+        """
+        cache_key = (hostname, username, port, validate_certs, http_proxy_host, http_proxy_port, http_proxy_protocol)
+        try:
+            return _SESSION_CACHE[cache_key]
+        except KeyError:
+            pass
+
+        session = _SharedSession()
+        ca_bundle = _get_ca_bundle() if validate_certs else None
+        # mount() does not replace adapters on a shared session, so set the adapter directly
+        session.adapters['https://'] = _SslContextHTTPAdapter(
+            _get_ssl_context(validate_certs, ca_bundle),
+            ca_bundle,
+            pool_connections=10,
+            pool_maxsize=50
+        )
+        self.__configure_session_ssl_context(session, validate_certs)
+        self.__configure_session_proxies(session, http_proxy_host, http_proxy_port, http_proxy_protocol)
+
+        _SESSION_CACHE[cache_key] = session
+        return session
+
     def __configure_session_ssl_context(self, session, validate_certs):
         session.verify = validate_certs
 
-        if not validate_certs:
+        global _INSECURE_REQUEST_WARNING_DISABLED
+        if not validate_certs and not _INSECURE_REQUEST_WARNING_DISABLED:
             if HAS_URLLIB3:
                 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                _INSECURE_REQUEST_WARNING_DISABLED = True
 
     def __configure_session_proxies(self, session, http_proxy_host, http_proxy_port, http_proxy_protocol):
         if all([http_proxy_host, http_proxy_port, http_proxy_protocol]):
+            proxy_url = "%s://%s:%s" % (http_proxy_protocol, http_proxy_host, http_proxy_port)
+            # requests chooses a proxy by the scheme of the target URL, not the proxy URL. The API is
+            # served over https, so the proxy must be set for both schemes to actually be used.
             http_proxies = {
-                http_proxy_protocol: (
-                    "{%s}://{%s}:{%s}" %
-                    http_proxy_protocol, http_proxy_host, http_proxy_port
-                )
+                'http': proxy_url,
+                'https': proxy_url
             }
 
             session.proxies.update(http_proxies)
 
-    def __create_client_connection(self, session, hostname, username, password, port):
+    def __create_client_connection_from_session_cache(self, session, hostname, username, password, port):
+        """
+        Try to reuse a session ID that was saved to disk by a previous module or plugin run. If there is no
+        saved session, or vCenter no longer accepts it, log in again and save the new session ID for next time.
+        """
+        cache_file = self.__get_session_cache_file(hostname, username, port)
+        session_id = self.__read_cached_session_id(cache_file)
+        client = None
+        if session_id and self.__is_session_id_valid(session, hostname, port, session_id):
+            try:
+                client = self.__create_client_connection(
+                    session, hostname, username, password, port, session_id=session_id
+                )
+            except ApiAccessError:
+                # fall back to a fresh login below
+                pass
+
+        if client is None:
+            client = self.__create_client_connection(session, hostname, username, password, port)
+            if getattr(client, 'session_id', None):
+                self.__write_cached_session_id(cache_file, client.session_id)
+
+        # the SDK logs out of the session when the client is deleted, which would invalidate the saved session
+        client.session_svc = _KeptSessionService()
+        return client
+
+    def __get_session_cache_file(self, hostname, username, port):
+        """
+        Get the path to the session cache file for this hostname, username, and port combination
+        """
+        key = hashlib.sha256(("%s|%s|%s" % (hostname, username, port)).encode('utf-8')).hexdigest()
+        return os.path.join(os.path.expanduser(SESSION_CACHE_DIR), "vmware_session_%s.json" % key)
+
+    def __read_cached_session_id(self, cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f).get('session_id')
+        except (IOError, OSError, ValueError, AttributeError):
+            return None
+
+    def __write_cached_session_id(self, cache_file, session_id):
+        """
+        Save the session ID to disk so only the current user can read it. Failing to save the
+        session is not fatal, the next run will just need to log in again.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_file), mode=0o700, exist_ok=True)
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                # the mode is only applied when the file is created, so fix the permissions of an existing file too
+                os.fchmod(f.fileno(), 0o600)
+                json.dump({'session_id': session_id}, f)
+        except (IOError, OSError):
+            pass
+
+    def __is_session_id_valid(self, session, hostname, port, session_id):
+        """
+        Check if vCenter still accepts the session ID. An expired or invalid session returns a 401.
+        The /api endpoints were added in vCenter 7.0U2, so older versions are checked using the
+        deprecated /rest endpoint instead.
+        """
+        headers = {'vmware-api-session-id': session_id}
+        try:
+            response = session.get("https://%s:%s/api/session" % (hostname, port), headers=headers)
+            if response.status_code == 404:
+                response = session.post(
+                    "https://%s:%s/rest/com/vmware/cis/session" % (hostname, port),
+                    params={'~action': 'get'},
+                    headers=headers
+                )
+        except requests.exceptions.RequestException:
+            return False
+
+        return response.status_code == 200
+
+    def __create_client_connection(self, session, hostname, username, password, port, session_id=None):
         msg = "Failed to connect to vCenter or ESXi API at %s:%s" % (hostname, port)
+        client_args = dict(
+            server="%s:%s" % (hostname, port),
+            session=session
+        )
+        # the SDK only accepts one authentication method, so credentials must not be sent with a session ID
+        if session_id:
+            client_args.update(session_id=session_id)
+        else:
+            client_args.update(username=username, password=password)
+
         try:
-            client = create_vsphere_client(
-                server="%s:%s" % (hostname, port),
-                username=username,
-                password=password,
-                session=session
-            )
+            client = create_vsphere_client(**client_args)
         except requests.exceptions.SSLError as e:
             msg += " due to SSL verification failure"
             raise ApiAccessError("%s : %s" % (msg, to_native(e)))
@@ -166,7 +410,7 @@ class VmwareRestClient():
         Returns:
             List of tag objects associated with the given virtual machine
         """
-        dobj = DynamicID(type='VirtualMachine', id=vm_moid)
+        dobj = _get_dynamic_id('VirtualMachine', vm_moid)
         return self.get_tags_for_dynamic_id_obj(dobj=dobj)
 
     def get_tags_by_host_moid(self, host_moid):
@@ -178,7 +422,7 @@ class VmwareRestClient():
         Returns:
             List of tag objects associated with the given host
         """
-        dobj = DynamicID(type='HostSystem', id=host_moid)
+        dobj = _get_dynamic_id('HostSystem', host_moid)
         return self.get_tags_for_dynamic_id_obj(dobj=dobj)
 
     def get_tags_for_dynamic_id_obj(self, dobj):
@@ -194,7 +438,43 @@ class VmwareRestClient():
             return tags
 
         tag_ids = self.tag_association_service.list_attached_tags(dobj)
-        for tag_id in tag_ids:
-            tags.append(self.tag_service.get(tag_id))
+        if not tag_ids:
+            return tags
+
+        return self.get_tags_by_ids(tag_ids)
 
-        return tags
+    def get_tags_by_ids(self, tag_ids):
+        """
+        Return tag objects for a list of tag IDs. Tags are cached by this client, so only tags that
+        have not been seen before are requested.
+        Args:
+            tag_ids: list(str), The tag IDs to get
+        Returns:
+            List of tag objects
+        """
+        missing_tag_ids = [tag_id for tag_id in tag_ids if tag_id not in self._tag_cache]
+        if missing_tag_ids:
+            self._tag_cache.update(self.__get_tags_from_api(missing_tag_ids))
+
+        return [self._tag_cache[tag_id] for tag_id in tag_ids]
+
+    def __get_tags_from_api(self, tag_ids):
+        """
+        Request tag objects from vCenter
+        Returns:
+            dict, tag IDs mapped to their tag objects
+        """
+        if len(tag_ids) == 1:
+            return {tag_ids[0]: self.tag_service.get(tag_ids[0])}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_TAG_REQUEST_THREADS, len(tag_ids))) as executor:
+            return dict(zip(tag_ids, executor.map(self.tag_service.get, tag_ids)))
+
+    def invalidate_tag(self, tag_id):
+        """
+        Remove a tag from this client's tag cache. Modules that change a tag should call this so
+        the tag is requested again the next time it is needed.
+        Args:
+            tag_id: str, The tag ID to remove from the cache
+        """
+        self._tag_cache.pop(tag_id, None)
@@ -8,6 +8,8 @@ from ansible_collections.vmware.vmware.plugins.module_utils.clients._pyvmomi imp
 from .common.utils import set_module_args
 from .common.vmware_object_mocks import MockCluster
 
+from pyVmomi import vim, vmodl
+
 
 class TestModulePyvmomiBase():
 
@@ -27,10 +29,39 @@ class TestModulePyvmomiBase():
 
     def test_get_objs_by_name_or_moid(self, mocker):
         self.__prepare(mocker)
+        clusters = [MockCluster('test1', moid='1'), MockCluster('test2', moid='2')]
         mock_view = mocker.Mock()
-        mock_view.view = [MockCluster('test1'), MockCluster('test2')]
+        mock_view.view = clusters
         mocker.patch.object(
             self.base.content.viewManager , 'CreateContainerView',
             return_value=mock_view
         )
-        assert self.base.get_objs_by_name_or_moid('vimtype', 'test1')
+        mocker.patch.object(
+            self.base, '_ModulePyvmomiBase__get_object_names_in_container_view',
+            return_value={'1': 'test1', '2': 'test2'}
+        )
+        assert self.base.get_objs_by_name_or_moid([vim.ClusterComputeResource], 'test1') is clusters[0]
+        assert self.base.get_objs_by_name_or_moid([vim.ClusterComputeResource], '2') is clusters[1]
+        assert self.base.get_objs_by_name_or_moid([vim.ClusterComputeResource], 'foo') is None
+
+    def test_get_object_names_in_container_view(self, mocker):
+        self.__prepare(mocker)
+        container = vim.view.ContainerView('view-1')
+        cluster = vim.ClusterComputeResource('domain-c1')
+        mock_retrieve = mocker.patch.object(
+            self.base.content.propertyCollector, 'RetrieveContents',
+            return_value=[
+                mocker.Mock(obj=cluster, propSet=[vmodl.DynamicProperty(name='name', val='test1')])
+            ]
+        )
+
+        object_names = self.base._ModulePyvmomiBase__get_object_names_in_container_view(
+            container, [vim.ClusterComputeResource]
+        )
+
+        assert object_names == {'domain-c1': 'test1'}
+        filter_spec = mock_retrieve.call_args.args[0][0]
+        assert filter_spec.objectSet[0].obj is container
+        assert filter_spec.objectSet[0].selectSet[0].path == 'view'
+        assert filter_spec.propSet[0].type is vim.ClusterComputeResource
+        assert filter_spec.propSet[0].pathSet == ['name']
@@ -1,11 +1,23 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import ssl
+import json
+import pytest
+
+from ansible_collections.vmware.vmware.plugins.module_utils.clients import _rest
 from ansible_collections.vmware.vmware.plugins.module_utils.clients._rest import VmwareRestClient
 
+from requests.adapters import DEFAULT_CA_BUNDLE_PATH
+from vmware.vapi.vsphere.client import create_vsphere_client
+
 
 class TestRestClient():
 
+    @pytest.fixture(autouse=True)
+    def clear_session_cache(self):
+        _rest._SESSION_CACHE.clear()
+
     def __prepare(self, mocker):
         client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
         client_mock.return_value = mocker.Mock()
@@ -32,3 +44,175 @@ class TestRestClient():
         objs = self.client.get_tags_by_vm_moid('id')
 
         assert len(objs) == 3
+
+    def test_get_tags_by_ids_cache(self, mocker):
+        self.__prepare(mocker)
+        mocked_tag_getter = mocker.patch.object(self.client.tag_service, 'get')
+
+        self.client.get_tags_by_ids(['1', '2'])
+        self.client.get_tags_by_ids(['1', '2', '3'])
+        assert mocked_tag_getter.call_count == 3
+
+        self.client.invalidate_tag('1')
+        self.client.get_tags_by_ids(['1'])
+        assert mocked_tag_getter.call_count == 4
+
+    def test_keep_session(self, mocker, tmp_path):
+        mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.SESSION_CACHE_DIR', str(tmp_path))
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        client_mock.return_value = mocker.Mock(session_id='abc')
+        session_check = mocker.patch('requests.Session.get')
+        connection_params = {
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'keep_session': True
+        }
+
+        # no cached session, so a new one is created and saved
+        VmwareRestClient(connection_params)
+        session_check.assert_not_called()
+        assert 'session_id' not in client_mock.call_args.kwargs
+        assert client_mock.call_args.kwargs['username'] == 'a'
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # cached session is still valid, so it is used instead of the username and password
+        session_check.return_value = mocker.Mock(status_code=200)
+        VmwareRestClient(connection_params)
+        assert client_mock.call_args.kwargs['session_id'] == 'abc'
+        assert 'username' not in client_mock.call_args.kwargs
+        assert 'password' not in client_mock.call_args.kwargs
+
+        # older vCenters do not have the /api endpoints, so the session is checked with the /rest endpoint
+        session_check.return_value = mocker.Mock(status_code=404)
+        legacy_session_check = mocker.patch('requests.Session.post')
+        legacy_session_check.return_value = mocker.Mock(status_code=200)
+        VmwareRestClient(connection_params)
+        legacy_session_check.assert_called_once()
+        assert client_mock.call_args.kwargs['session_id'] == 'abc'
+
+        # cached session has expired
+        session_check.return_value = mocker.Mock(status_code=401)
+        VmwareRestClient(connection_params)
+        assert 'session_id' not in client_mock.call_args.kwargs
+
+    def test_keep_session_is_not_deleted(self, mocker, tmp_path):
+        mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.SESSION_CACHE_DIR', str(tmp_path))
+        mocker.patch('requests.Session.get').return_value = mocker.Mock(status_code=200)
+        session_delete = mocker.patch('com.vmware.cis_client.Session.delete')
+        cache_file = tmp_path / 'cached_session.json'
+        cache_file.write_text('{"session_id": "abc"}')
+        mocker.patch.object(VmwareRestClient, '_VmwareRestClient__get_session_cache_file', return_value=str(cache_file))
+
+        # a real SDK client is used, since the SDK deletes its session when the client is deleted
+        client = VmwareRestClient({
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'keep_session': True
+        })
+        assert client.api_client.session_id == 'abc'
+        client.api_client.__del__()
+        session_delete.assert_not_called()
+
+    def test_keep_session_file_permissions(self, mocker, tmp_path):
+        mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.SESSION_CACHE_DIR', str(tmp_path))
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        client_mock.return_value = mocker.Mock(session_id='abc')
+        cache_file = tmp_path / 'cached_session.json'
+        cache_file.write_text('{}')
+        cache_file.chmod(0o644)
+        mocker.patch.object(VmwareRestClient, '_VmwareRestClient__get_session_cache_file', return_value=str(cache_file))
+
+        VmwareRestClient({
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'keep_session': True
+        })
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        assert json.loads(cache_file.read_text()) == {'session_id': 'abc'}
+
+    def test_session_is_shared(self, mocker):
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        connection_params = {
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'validate_certs': False
+        }
+
+        VmwareRestClient(connection_params)
+        first_session = client_mock.call_args.kwargs['session']
+        VmwareRestClient(connection_params)
+        assert client_mock.call_args.kwargs['session'] is first_session
+
+        VmwareRestClient({**connection_params, **{'validate_certs': True}})
+        assert client_mock.call_args.kwargs['session'] is not first_session
+
+        VmwareRestClient({**connection_params, **{'username': 'b'}})
+        assert client_mock.call_args.kwargs['session'] is not first_session
+
+    def test_session_validate_certs_default(self, mocker):
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        VmwareRestClient({
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'validate_certs': None
+        })
+
+        session = client_mock.call_args.kwargs['session']
+        assert session.verify is True
+        adapter = session.get_adapter('https://a')
+        assert adapter.ssl_context.verify_mode == ssl.CERT_REQUIRED
+        assert adapter.ca_bundle == _rest._get_ca_bundle()
+
+    def test_session_proxies(self, mocker):
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        VmwareRestClient({
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a',
+            'http_proxy_host': 'proxy',
+            'http_proxy_port': 3128,
+            'http_proxy_protocol': 'http'
+        })
+
+        session = client_mock.call_args.kwargs['session']
+        assert session.proxies['http'] == 'http://proxy:3128'
+        assert session.proxies['https'] == 'http://proxy:3128'
+
+    def test_shared_session_survives_clients(self, mocker):
+        client_mock = mocker.patch('ansible_collections.vmware.vmware.plugins.module_utils.clients._rest.create_vsphere_client')
+        VmwareRestClient({
+            'hostname': 'a',
+            'username': 'a',
+            'password': 'a'
+        })
+        session = client_mock.call_args.kwargs['session']
+        adapter = session.get_adapter('https://a')
+        adapter_close = mocker.patch.object(adapter, 'close')
+
+        # a real SDK client mounts its own adapters and closes the session when it is deleted
+        sdk_client = create_vsphere_client(server='a:443', session=session, session_id='abc')
+        mocker.patch.object(sdk_client.session_svc, 'delete')
+        sdk_client.__del__()
+
+        assert session.get_adapter('https://a') is adapter
+        adapter_close.assert_not_called()
+
+    def test_ssl_context_ca_bundle_not_reloaded(self, mocker, tmp_path):
+        adapter = _rest._SslContextHTTPAdapter(
+            _rest._get_ssl_context(True, DEFAULT_CA_BUNDLE_PATH), DEFAULT_CA_BUNDLE_PATH
+        )
+        conn = mocker.Mock()
+        adapter.cert_verify(conn, 'https://a', DEFAULT_CA_BUNDLE_PATH, None)
+        assert conn.cert_reqs == 'CERT_REQUIRED'
+        assert conn.ca_certs is None
+
+        # a different CA bundle is not in the shared context, so it still needs to be loaded
+        custom_bundle = tmp_path / 'ca.pem'
+        custom_bundle.write_text('')
+        adapter.cert_verify(conn, 'https://a', str(custom_bundle), None)
+        assert conn.ca_certs == str(custom_bundle)
@@ -0,0 +1,47 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.vmware.vmware.plugins.module_utils._vmware_facts import (
+    walk_snapshot_tree,
+    list_snapshots
+)
+
+
+class MockSnapshotTree():
+    def __init__(self, name, children=None):
+        self.name = name
+        self.id = name
+        self.description = ''
+        self.createTime = None
+        self.state = 'poweredOff'
+        self.quiesced = False
+        self.snapshot = 'snapshot-%s' % name
+        self.childSnapshotList = children or []
+
+
+class TestVmwareFacts():
+
+    def __prepare_tree(self):
+        return [
+            MockSnapshotTree('a', [
+                MockSnapshotTree('b', [MockSnapshotTree('c')]),
+                MockSnapshotTree('d'),
+            ]),
+            MockSnapshotTree('e', [MockSnapshotTree('c')]),
+        ]
+
+    def test_walk_snapshot_tree(self):
+        names = [snapshot.name for snapshot in walk_snapshot_tree(self.__prepare_tree())]
+        assert names == ['a', 'b', 'c', 'd', 'e', 'c']
+
+    def test_list_snapshots(self, mocker):
+        vm = mocker.Mock()
+        vm.snapshot.rootSnapshotList = self.__prepare_tree()
+        vm.snapshot.currentSnapshot = 'snapshot-d'
+
+        result = list_snapshots(vm)
+        assert [snapshot['name'] for snapshot in result['snapshots']] == ['a', 'b', 'c', 'd', 'e', 'c']
+        assert result['current_snapshot']['name'] == 'd'
+
+        vm.snapshot = None
+        assert list_snapshots(vm) == {}